@@ -1,11 +1,120 @@
+from __future__ import annotations
+
+import importlib.util
 import json
-import pandas as pd
+from typing import TYPE_CHECKING
+
 import streamlit as st
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas is imported lazily inside parse_json_to_df so that first render on a
+# cold worker does not pay its import cost before any conversion runs.
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to CSV bytes, memoized across reruns.
+
+    Streamlit re-executes the page on every interaction while the user sits
+    on the converted view, so without caching the full CSV would be
+    re-serialized on each rerun just to back the download button.
+
+    When pyarrow is installed the bytes are written in one pass by Arrow's
+    multithreaded CSV writer; df.to_csv builds the full CSV as a Python str
+    and then re-encodes it, two complete copies of the payload.
+    """
+    if _HAS_PYARROW:
+        import io
+
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        try:
+            buf = io.BytesIO()
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buf)
+            return buf.getvalue()
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Frames Arrow cannot represent (e.g. mixed-type object columns)
+            # fall back to pandas.
+            pass
+    return df.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _df_to_parquet_bytes(df: pd.DataFrame) -> bytes | None:
+    """
+    Serialize a DataFrame to zstd-compressed Parquet bytes, memoized.
+
+    Parquet serializes several times faster than CSV and compresses much
+    smaller, which matters for large converted frames. Requires pyarrow.
+    Returns None for frames Arrow cannot represent (e.g. mixed-type object
+    columns); the caller skips the Parquet button in that case.
+    """
+    import io
+
+    import pyarrow as pa
+
+    buf = io.BytesIO()
+    try:
+        df.to_parquet(buf, compression="zstd")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    return buf.getvalue()
+
 
+def _loads(raw_text: str):
+    """Parse JSON text, preferring orjson over the stdlib when installed."""
+    if orjson is not None:
+        return orjson.loads(raw_text)
+    return json.loads(raw_text)
+
+
+def _looks_like_ndjson(raw_text: str) -> bool:
+    """Return True if the text looks like newline-delimited JSON objects."""
+    lines = [line for line in raw_text.splitlines() if line.strip()]
+    return len(lines) > 1 and all(
+        line.lstrip().startswith("{") and line.rstrip().endswith("}") for line in lines
+    )
+
+
+def _ndjson_to_df(raw_text: str, normalize: bool) -> pd.DataFrame:
+    """
+    Parse newline-delimited JSON straight into a DataFrame with pyarrow.
+
+    Arrow's multithreaded JSON reader builds columns directly, skipping the
+    Python-object materialization of loads-then-DataFrame entirely. Struct
+    columns are flattened to dotted names when `normalize` is set, matching
+    json_normalize's output shape.
+    """
+    import io as _io
+
+    import pyarrow.json as paj
+    import pyarrow.types as pa_types
+
+    table = paj.read_json(_io.BytesIO(raw_text.encode("utf-8")))
+    if normalize:
+        while any(pa_types.is_struct(t) for t in table.schema.types):
+            table = table.flatten()
+    return table.to_pandas()
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
 def parse_json_to_df(raw_text: str, normalize: bool = True) -> pd.DataFrame:
     """Parse JSON text into a pandas DataFrame.
 
+    Memoized with st.cache_data so Streamlit reruns with identical input and
+    options (e.g. repeated button clicks) skip the parse entirely.
+
     This function handles various JSON structures and converts them to DataFrames:
     - Single JSON objects are converted to single-row DataFrames
     - Arrays of objects are converted to multi-row DataFrames
@@ -30,20 +139,51 @@ def parse_json_to_df(raw_text: str, normalize: bool = True) -> pd.DataFrame:
         >>> parse_json_to_df('{"a": [1, 2], "b": [3, 4]}')  # Dict with lists
         >>> parse_json_to_df('{"nested": {"key": "value"}}', normalize=True)
     """
+    import pandas as pd
+
     raw_text = raw_text.strip()
     if not raw_text:
         raise ValueError("No JSON provided")
 
-    data = json.loads(raw_text)
+    if _HAS_PYARROW and _looks_like_ndjson(raw_text):
+        try:
+            return _ndjson_to_df(raw_text, normalize)
+        except Exception:
+            # Fall through to the standard parser for an exact error message.
+            pass
+
+    data = _loads(raw_text)
 
     if isinstance(data, dict):
-        if data and all(isinstance(v, list) for v in data.values()):
+        # type(v) is list is a single pointer compare per value, cheaper than
+        # isinstance's subclass walk, and json only ever produces exact lists.
+        # A plain loop also skips the generator-frame overhead of all(...)
+        # while keeping the early exit on the first non-list value.
+        values = data.values()
+        column_oriented = bool(values)
+        for v in values:
+            if type(v) is not list:
+                column_oriented = False
+                break
+        if column_oriented:
             if normalize:
                 return pd.json_normalize(data)
             return pd.DataFrame(data)
         data = [data]
 
     if normalize:
+        # json_normalize is several times slower than the plain constructor
+        # on input that is already flat. One pass over every record's values
+        # detects the flat case and is still far cheaper than normalizing;
+        # any nested value anywhere in the list routes to json_normalize.
+        if (
+            data
+            and all(type(rec) is dict for rec in data)
+            and not any(
+                isinstance(v, (dict, list)) for rec in data for v in rec.values()
+            )
+        ):
+            return pd.DataFrame(data)
         return pd.json_normalize(data)
 
     try:
@@ -52,17 +192,20 @@ def parse_json_to_df(raw_text: str, normalize: bool = True) -> pd.DataFrame:
         return pd.json_normalize(data)
 
 
+# Example JSON shown in the text area on first visit.
+_DEFAULT_JSON = """[
+    {"name": "Alice", "age": 30, "address": {"city": "New York", "state": "NY"}},
+    {"name": "Bob", "age": 25, "address": {"city": "San Francisco", "state": "CA"}}
+]
+"""
+
+
 def _ensure_state():
-    if "json_input" not in st.session_state:
-        st.session_state.json_input = ""
-    if "json_normalize" not in st.session_state:
-        st.session_state.json_normalize = True
-    if "json_converted" not in st.session_state:
-        st.session_state.json_converted = False
-    if "json_df" not in st.session_state:
-        st.session_state.json_df = None
-    if "json_convert_error" not in st.session_state:
-        st.session_state.json_convert_error = ""
+    st.session_state.setdefault("json_input", _DEFAULT_JSON)
+    st.session_state.setdefault("json_normalize", True)
+    st.session_state.setdefault("json_converted", False)
+    st.session_state.setdefault("json_df", None)
+    st.session_state.setdefault("json_convert_error", "")
 
 
 def do_convert():
@@ -106,14 +249,23 @@ def render():
         df = st.session_state.json_df
         if df is not None:
             st.dataframe(df)
-            csv_bytes = df.to_csv(index=False).encode("utf-8")
             st.download_button(
                 "📥 Download CSV",
-                csv_bytes,
+                _df_to_csv_bytes(df),
                 file_name="converted.csv",
                 mime="text/csv",
                 type="secondary",
             )
+            if _HAS_PYARROW:
+                parquet_bytes = _df_to_parquet_bytes(df)
+                if parquet_bytes is not None:
+                    st.download_button(
+                        "📥 Download Parquet",
+                        parquet_bytes,
+                        file_name="converted.parquet",
+                        mime="application/octet-stream",
+                        type="secondary",
+                    )
 
         st.button("Back", on_click=go_back, type="primary")
 
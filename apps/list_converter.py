@@ -0,0 +1,148 @@
+import streamlit as st
+
+
+# Translate all supported separators to spaces in a single C-level pass, then
+# let str.split() handle the strip-and-filter-empty step. This avoids the
+# per-character dispatch cost of a regex split on large pasted lists.
+_TRANS = str.maketrans({",": " ", "\t": " ", "\r": " ", "\n": " "})
+
+# Table-driven quoting and wrapping: (quote_char, escape_from, escape_to) and
+# (prefix, suffix). A single lookup replaces the if/elif cascades, and unknown
+# keys fall back to the unquoted/unwrapped entry.
+_QUOTES = {
+    "single": ("'", "'", "''"),
+    "double": ('"', '"', '\\"'),
+    "none": ("", "", ""),
+}
+_WRAPS = {
+    "paren": ("(", ")"),
+    "bracket": ("[", "]"),
+    "brace": ("{", "}"),
+    "none": ("", ""),
+}
+
+
+def convert_list(
+    text: str,
+    quote: str = "single",
+    wrapper: str = "none",
+    remove_dupes: bool = False,
+    separator: str = ", ",
+) -> str:
+    """
+    Convert a pasted list of items into a delimited, quoted string.
+
+    Items may be separated by commas, tabs, newlines, or whitespace. Empty
+    entries are dropped. The result is handy for building SQL IN clauses or
+    code literals from a column of values copied out of a spreadsheet.
+
+    Args:
+        text: The raw pasted text containing the items.
+        quote: Quoting style for each item: "single", "double", or "none".
+            Quote characters inside items are escaped ('' for single
+            quotes, \\" for double quotes).
+        wrapper: Wrapper around the whole output: "paren", "bracket",
+            "brace", or "none".
+        remove_dupes: If True, drop duplicate items while preserving the
+            order of first appearance.
+        separator: String placed between items in the output.
+
+    Returns:
+        The converted single-string representation of the list.
+
+    Example:
+        >>> convert_list("a\\nb\\na", wrapper="paren", remove_dupes=True)
+        "('a', 'b')"
+    """
+    items = text.translate(_TRANS).split()
+
+    if remove_dupes:
+        # dict.fromkeys preserves insertion order and dedups entirely in C.
+        items = list(dict.fromkeys(items))
+
+    # Build the body with a single join (the quote characters fold into the
+    # joiner) rather than allocating one quoted copy of every item first.
+    qc, esc_from, esc_to = _QUOTES.get(quote, _QUOTES["none"])
+    if not items:
+        body = ""
+    elif esc_from:
+        body = qc + (qc + separator + qc).join(it.replace(esc_from, esc_to) for it in items) + qc
+    else:
+        body = separator.join(items)
+
+    prefix, suffix = _WRAPS.get(wrapper, _WRAPS["none"])
+    return prefix + body + suffix
+
+
+def _ensure_state():
+    st.session_state.setdefault("list_input", "")
+    st.session_state.setdefault("list_quote", "single")
+    st.session_state.setdefault("list_wrapper", "none")
+    st.session_state.setdefault("list_remove_dupes", False)
+    st.session_state.setdefault("list_converted", False)
+    st.session_state.setdefault("list_output", "")
+    st.session_state.setdefault("list_convert_error", "")
+
+
+def _do_convert():
+    st.session_state.list_convert_error = ""
+    txt = st.session_state.get("list_input", "")
+    if not txt or not txt.strip():
+        st.session_state.list_convert_error = "No list text provided"
+        return
+    try:
+        st.session_state.list_output = convert_list(
+            txt,
+            quote=st.session_state.list_quote,
+            wrapper=st.session_state.list_wrapper,
+            remove_dupes=st.session_state.list_remove_dupes,
+        )
+        st.session_state.list_converted = True
+    except Exception as e:
+        st.session_state.list_convert_error = str(e)
+
+
+def _go_back():
+    st.session_state.list_converted = False
+
+
+def render():
+    st.title("List Converter")
+    _ensure_state()
+
+    # Reset page-specific state when navigating to this page from another page
+    page_id = "list_converter"
+    if st.session_state.get("last_rendered_page") != page_id:
+        st.session_state.list_converted = False
+
+    if not st.session_state.list_converted:
+        col_left, col_right = st.columns([6, 4])
+        with col_left:
+            st.text_area("Paste list items here", height=320, key="list_input")
+        with col_right:
+            st.radio("Quote style", ["single", "double", "none"], key="list_quote")
+            st.radio("Wrap output in", ["none", "paren", "bracket", "brace"], key="list_wrapper")
+            st.checkbox("Remove duplicates", key="list_remove_dupes")
+
+        st.button("Convert List", on_click=_do_convert, type="primary")
+
+        if st.session_state.list_convert_error:
+            st.error(st.session_state.list_convert_error)
+
+    else:
+        st.subheader("Converted List")
+        st.code(st.session_state.list_output, language=None)
+        st.download_button(
+            label="Download as text",
+            data=st.session_state.list_output,
+            file_name="converted_list.txt",
+            mime="text/plain",
+        )
+        st.button("Back", on_click=_go_back, type="primary")
+
+    # mark this page as the last rendered so other pages can detect navigation
+    st.session_state.last_rendered_page = page_id
+
+
+if __name__ == "__main__":
+    render()